@@ -2,8 +2,8 @@
 Authentication controller for FastAPI endpoints.
 """
 
+from functools import lru_cache
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPBearer
 
 from ..schemas.auth import (
     UserRegistration, 
@@ -14,148 +14,116 @@ from ..schemas.auth import (
 )
 from ..services.auth_service import AuthService
 from ..core.dependencies import get_current_user, require_admin
-from ..core.exceptions import (
-    AuthenticationError,
-    ValidationError,
-    ConflictError,
-    NotFoundError
-)
+from ..core.security import UserCtx
+from ..core.responses import ORJSONResponse
 
 
 router = APIRouter()
-auth_service = AuthService()
+
+
+@lru_cache(maxsize=1)
+def _build_auth_service() -> AuthService:
+    """Create the shared auth service lazily, after workers have started."""
+    return AuthService()
+
+
+async def get_auth_service() -> AuthService:
+    """Get the shared auth service (async so FastAPI skips the threadpool)."""
+    return _build_auth_service()
+
+
+# Static payloads are rendered once at import instead of on every request
+_HEALTH_PAYLOAD = {
+    "service": "auth",
+    "status": "healthy",
+    "endpoints": (
+        "POST /register",
+        "POST /login",
+        "POST /refresh",
+        "GET /me",
+        "POST /change-password",
+        "POST /logout"
+    )
+}
+_HEALTH_JSON = ORJSONResponse(_HEALTH_PAYLOAD)
+_LOGOUT_RESPONSE = ORJSONResponse({"message": "Logged out successfully"})
 
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserRegistration):
+async def register(
+    user_data: UserRegistration,
+    auth_service: AuthService = Depends(get_auth_service)
+):
     """Register a new user account."""
-    try:
-        return await auth_service.register_user(user_data)
-    except ConflictError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
+    return ORJSONResponse(
+        await auth_service.register_user(user_data),
+        status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(user_data: UserLogin):
+async def login(
+    user_data: UserLogin,
+    auth_service: AuthService = Depends(get_auth_service)
+):
     """User login authentication."""
-    try:
-        return await auth_service.login_user(user_data)
-    except AuthenticationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+    return ORJSONResponse(await auth_service.login_user(user_data))
 
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(refresh_token: str):
+async def refresh_token(
+    refresh_token: str,
+    auth_service: AuthService = Depends(get_auth_service)
+):
     """Refresh access token."""
-    try:
-        return await auth_service.refresh_token(refresh_token)
-    except AuthenticationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+    return ORJSONResponse(await auth_service.refresh_token(refresh_token))
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: dict = Depends(get_current_user)):
+async def get_current_user_info(
+    current_user: UserCtx = Depends(get_current_user),
+    auth_service: AuthService = Depends(get_auth_service)
+):
     """Get current user information."""
-    try:
-        return await auth_service.get_current_user(current_user["user_id"])
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+    return ORJSONResponse(await auth_service.get_current_user(current_user.user_id))
 
 
 @router.post("/change-password")
 async def change_password(
     password_data: PasswordChange,
-    current_user: dict = Depends(get_current_user)
+    current_user: UserCtx = Depends(get_current_user),
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Change user password."""
-    try:
-        success = await auth_service.change_password(
-            current_user["user_id"],
-            password_data.current_password,
-            password_data.new_password
-        )
-        
-        if success:
-            return {"message": "Password changed successfully"}
-        
-    except AuthenticationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e)
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+    await auth_service.change_password(
+        current_user.user_id,
+        password_data.current_password,
+        password_data.new_password
+    )
+    return {"message": "Password changed successfully"}
 
 
 @router.post("/logout")
-async def logout(current_user: dict = Depends(get_current_user)):
+async def logout(current_user: UserCtx = Depends(get_current_user)):
     """User logout (client-side token removal)."""
     # In JWT, logout is handled client-side by removing the token
     # Server-side logout would require token blacklisting
-    return {"message": "Logged out successfully"}
+    return _LOGOUT_RESPONSE
 
 
 @router.post("/admin/deactivate-user")
 async def admin_deactivate_user(
     target_user_id: str,
-    admin_user: dict = Depends(require_admin)
+    admin_user: UserCtx = Depends(require_admin),
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Admin endpoint to deactivate a user account."""
-    try:
-        success = await auth_service.deactivate_user(
-            admin_user["user_id"],
-            target_user_id
-        )
-        
-        if success:
-            return {"message": f"User {target_user_id} deactivated successfully"}
-        
-    except AuthenticationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e)
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except NotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+    await auth_service.deactivate_user(admin_user.user_id, target_user_id)
+    return {"message": f"User {target_user_id} deactivated successfully"}
 
 
 @router.get("/admin/init")
-async def initialize_admin():
+async def initialize_admin(auth_service: AuthService = Depends(get_auth_service)):
     """Initialize admin user (one-time setup)."""
     try:
         admin_user = await auth_service.ensure_admin_exists()
@@ -172,7 +140,7 @@ async def initialize_admin():
 
 
 @router.get("/init-demo-accounts")
-async def initialize_demo_accounts():
+async def initialize_demo_accounts(auth_service: AuthService = Depends(get_auth_service)):
     """Initialize demo accounts for testing (admin + user)."""
     try:
         accounts = await auth_service.init_default_accounts()
@@ -202,15 +170,4 @@ async def initialize_demo_accounts():
 @router.get("/health")
 async def auth_health_check():
     """Auth service health check."""
-    return {
-        "service": "auth",
-        "status": "healthy",
-        "endpoints": [
-            "POST /register",
-            "POST /login", 
-            "POST /refresh",
-            "GET /me",
-            "POST /change-password",
-            "POST /logout"
-        ]
-    }
+    return _HEALTH_JSON
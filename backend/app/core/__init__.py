@@ -15,7 +15,7 @@ from .exceptions import (
     ExternalServiceError
 )
 from .logging import setup_logging
-from .security import security, validate_password_strength
+from .security import security, validate_password_strength, UserCtx
 from .dependencies import (
     get_current_user,
     get_current_active_user,
@@ -29,6 +29,7 @@ __all__ = [
     "setup_logging",
     "security",
     "validate_password_strength",
+    "UserCtx",
     "get_current_user",
     "get_current_active_user",
     "require_admin",
@@ -4,6 +4,7 @@ Handles environment-specific settings for dev/prod environments.
 """
 
 import os
+from functools import lru_cache
 from typing import List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -27,6 +28,8 @@ class Settings(BaseSettings):
     # Database Configuration
     mongodb_uri: str = Field(env="MONGODB_URI")
     mongodb_db_name: str = Field(env="MONGODB_DB_NAME")
+    mongodb_max_pool_size: int = Field(default=100, env="MONGODB_MAX_POOL_SIZE")
+    mongodb_min_pool_size: int = Field(default=10, env="MONGODB_MIN_POOL_SIZE")
     
     # Milvus Configuration
     milvus_uri: str = Field(env="MILVUS_URI")
@@ -46,6 +49,9 @@ class Settings(BaseSettings):
     jwt_secret: str = Field(env="JWT_SECRET")
     jwt_algorithm: str = Field(default="HS256", env="JWT_ALGORITHM")
     jwt_expire_minutes: int = Field(default=1440, env="JWT_EXPIRE_MINUTES")
+    bcrypt_rounds: int = Field(default=10, env="BCRYPT_ROUNDS")
+    bcrypt_workers: Optional[int] = Field(default=None, env="BCRYPT_WORKERS")
+    auth_jwt_cache: bool = Field(default=True, env="AUTH_JWT_CACHE")
     
     # Admin Configuration
     admin_email: str = Field(env="ADMIN_EMAIL")
@@ -83,8 +89,9 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings instance."""
+    """Get application settings instance (cached after first call)."""
     env_file = os.getenv("ENV_FILE", ".env.dev")
     return Settings(_env_file=env_file)
 
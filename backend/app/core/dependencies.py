@@ -3,57 +3,89 @@ FastAPI dependencies for authentication and authorization.
 """
 
 from typing import Optional
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import Depends, HTTPException, Request, status
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from .security import security, extract_user_from_token
+from .security import security, UserCtx
 from .exceptions import AuthenticationError, AuthorizationError
 from ..models.user import UserRole
 
 
-# HTTP Bearer token scheme
-security_scheme = HTTPBearer()
+# Role values hoisted out of the per-request checks
+_ADMIN = UserRole.ADMIN.value
+_USER = UserRole.USER.value
+_USER_OR_ADMIN = frozenset({_USER, _ADMIN})
 
 
-async def get_current_user_token(
-    credentials: HTTPAuthorizationCredentials = Depends(security_scheme)
-) -> dict:
-    """Extract and verify current user from JWT token."""
-    try:
-        token_data = security.verify_token(credentials.credentials)
-        user_info = extract_user_from_token(token_data)
-        
-        if not user_info.get("user_id"):
-            raise AuthenticationError("Invalid token payload")
+# Routes that never require a bearer token (exact paths, not prefixes, so
+# routes added under them still get their token resolved)
+PUBLIC_PATHS = frozenset({
+    "/health",
+    "/api/v1/auth/register",
+    "/api/v1/auth/login",
+    "/api/v1/auth/health",
+})
+
+
+class AuthASGIMiddleware:
+    """Pure ASGI middleware that resolves the bearer token once per request.
+
+    The decoded user is stored in ``request.state.user`` so route dependencies
+    only read an attribute instead of going through ``HTTPBearer``.
+    """
+    
+    def __init__(self, app: ASGIApp, public_paths: frozenset = PUBLIC_PATHS):
+        self.app = app
+        self.public_paths = public_paths
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] not in self.public_paths:
+            state = scope.setdefault("state", {})
+            token = self._extract_bearer(scope["headers"])
+            
+            if token:
+                try:
+                    state["user"] = security.authenticate(token)
+                except AuthenticationError as e:
+                    state["auth_error"] = e.message
         
-        return user_info
+        await self.app(scope, receive, send)
     
-    except AuthenticationError as e:
+    @staticmethod
+    def _extract_bearer(headers: list) -> Optional[str]:
+        """Return the bearer token from raw ASGI headers, if any."""
+        for name, value in headers:
+            if name == b"authorization":
+                scheme, _, token = value.partition(b" ")
+                if scheme.lower() == b"bearer" and token:
+                    return token.decode("latin-1")
+                return None
+        return None
+
+
+async def get_current_user(request: Request) -> UserCtx:
+    """Get current authenticated user resolved by AuthASGIMiddleware."""
+    user = getattr(request.state, "user", None)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
+            detail=getattr(request.state, "auth_error", "Not authenticated"),
             headers={"WWW-Authenticate": "Bearer"},
         )
-
-
-async def get_current_user(
-    current_user: dict = Depends(get_current_user_token)
-) -> dict:
-    """Get current authenticated user."""
-    return current_user
+    return user
 
 
 async def get_current_active_user(
-    current_user: dict = Depends(get_current_user)
-) -> dict:
+    current_user: UserCtx = Depends(get_current_user)
+) -> UserCtx:
     """Get current active user (can add additional checks here)."""
     # TODO: Check user status in database if needed
     return current_user
 
 
-def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
+async def require_admin(current_user: UserCtx = Depends(get_current_user)) -> UserCtx:
     """Require admin role for access."""
-    if current_user.get("role") != UserRole.ADMIN.value:
+    if current_user.role != _ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
@@ -61,10 +93,9 @@ def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
     return current_user
 
 
-def require_user_or_admin(current_user: dict = Depends(get_current_user)) -> dict:
+async def require_user_or_admin(current_user: UserCtx = Depends(get_current_user)) -> UserCtx:
     """Require user or admin role for access."""
-    user_role = current_user.get("role")
-    if user_role not in [UserRole.USER.value, UserRole.ADMIN.value]:
+    if current_user.role not in _USER_OR_ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User access required"
@@ -77,16 +108,18 @@ class RoleChecker:
     
     def __init__(self, allowed_roles: list):
         self.allowed_roles = allowed_roles
+        self._allowed = frozenset(allowed_roles)
+        self._detail = f"Access denied. Required roles: {', '.join(allowed_roles)}"
     
-    def __call__(self, current_user: dict = Depends(get_current_user)):
-        if current_user.get("role") not in self.allowed_roles:
+    async def __call__(self, current_user: UserCtx = Depends(get_current_user)) -> UserCtx:
+        if current_user.role not in self._allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required roles: {', '.join(self.allowed_roles)}"
+                detail=self._detail
             )
         return current_user
 
 
 # Pre-defined role checkers
-admin_required = RoleChecker([UserRole.ADMIN.value])
-user_required = RoleChecker([UserRole.USER.value, UserRole.ADMIN.value])
+admin_required = RoleChecker([_ADMIN])
+user_required = RoleChecker([_USER, _ADMIN])
@@ -10,72 +10,78 @@ from typing import Dict, Any
 from app.core.config import settings
 
 
-def setup_logging() -> None:
-    """Setup application logging configuration."""
-    
-    log_config: Dict[str, Any] = {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "default": {
-                "format": "[%(asctime)s] %(levelname)s in %(module)s: %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S"
-            },
-            "detailed": {
-                "format": "[%(asctime)s] %(levelname)s in %(module)s [%(pathname)s:%(lineno)d]: %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S"
-            },
-            "json": {
-                "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
-                "format": "%(asctime)s %(name)s %(levelname)s %(message)s"
-            }
+_LOG_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "format": "[%(asctime)s] %(levelname)s in %(module)s: %(message)s",
+            "datefmt": "%Y-%m-%d %H:%M:%S"
         },
-        "handlers": {
-            "console": {
-                "class": "logging.StreamHandler",
-                "level": settings.log_level.upper(),
-                "formatter": "detailed" if settings.is_development else "default",
-                "stream": sys.stdout
-            }
+        "detailed": {
+            "format": "[%(asctime)s] %(levelname)s in %(module)s [%(pathname)s:%(lineno)d]: %(message)s",
+            "datefmt": "%Y-%m-%d %H:%M:%S"
         },
-        "root": {
+        "json": {
+            "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
+            "format": "%(asctime)s %(name)s %(levelname)s %(message)s"
+        }
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
             "level": settings.log_level.upper(),
-            "handlers": ["console"]
-        },
-        "loggers": {
-            "uvicorn": {
-                "level": "INFO",
-                "handlers": ["console"],
-                "propagate": False
-            },
-            "uvicorn.error": {
-                "level": "INFO",
-                "handlers": ["console"],
-                "propagate": False
-            },
-            "uvicorn.access": {
-                "level": "INFO",
-                "handlers": ["console"],
-                "propagate": False
-            }
+            "formatter": "detailed" if settings.is_development else "default",
+            "stream": sys.stdout
         }
-    }
-    
-    # Add file handler in production
-    if settings.is_production:
-        log_config["handlers"]["file"] = {
-            "class": "logging.handlers.RotatingFileHandler",
+    },
+    "root": {
+        "level": settings.log_level.upper(),
+        "handlers": ["console"]
+    },
+    "loggers": {
+        "uvicorn": {
             "level": "INFO",
-            "formatter": "json",
-            "filename": "/app/logs/app.log",
-            "maxBytes": 10485760,  # 10MB
-            "backupCount": 5
-        }
-        log_config["root"]["handlers"].append("file")
-    
-    logging.config.dictConfig(log_config)
+            "handlers": ["console"],
+            "propagate": False
+        },
+        "uvicorn.error": {
+            "level": "INFO",
+            "handlers": ["console"],
+            "propagate": False
+        },
+        "uvicorn.access": {
+            "level": "INFO",
+            "handlers": ["console"],
+            "propagate": False
+        },
+        # External libraries
+        "pymongo": {"level": "WARNING"},
+        "motor": {"level": "WARNING"},
+        "httpx": {"level": "WARNING"}
+    }
+}
+
+# Add file handler in production
+if settings.is_production:
+    _LOG_CONFIG["handlers"]["file"] = {
+        "class": "logging.handlers.RotatingFileHandler",
+        "level": "INFO",
+        "formatter": "json",
+        "filename": "/app/logs/app.log",
+        "maxBytes": 10485760,  # 10MB
+        "backupCount": 5
+    }
+    _LOG_CONFIG["root"]["handlers"].append("file")
+
+_configured = False
+
+
+def setup_logging() -> None:
+    """Setup application logging configuration (idempotent)."""
+    global _configured
+    if _configured:
+        return
     
-    # Set external libraries log levels
-    logging.getLogger("pymongo").setLevel(logging.WARNING)
-    logging.getLogger("motor").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.config.dictConfig(_LOG_CONFIG)
+    _configured = True
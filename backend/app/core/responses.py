@@ -0,0 +1,53 @@
+"""
+Fast JSON responses backed by orjson.
+"""
+
+from typing import Any, Dict, Optional
+
+import orjson
+from bson import ObjectId
+from pydantic import BaseModel
+from starlette.responses import Response
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered directly with orjson.
+
+    Returning this from an endpoint skips FastAPI's jsonable_encoder and
+    response_model re-validation. Datetimes, enums and dataclasses are
+    handled natively by orjson; pydantic models and ObjectIds go through
+    ``_default``.
+    """
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NAIVE_UTC)
+
+
+def stream_event(
+    event_type: str,
+    content: Optional[str] = None,
+    message_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """Serialize one streaming chat frame.
+
+    Produces the same JSON shape as ``schemas.chat.StreamingResponse`` without
+    building a pydantic model per token; that schema stays as documentation.
+    """
+    return orjson.dumps({
+        "type": event_type,
+        "content": content,
+        "message_id": message_id,
+        "metadata": metadata or {}
+    })
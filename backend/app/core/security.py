@@ -2,38 +2,133 @@
 Security utilities for JWT token handling and password management.
 """
 
-from jose import jwt
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
-from passlib.context import CryptContext
-from passlib.hash import bcrypt
+import asyncio
+import base64
+import binascii
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import jwt
+from datetime import timedelta
+from typing import Optional, Dict, Any, Tuple
+from cachetools import TTLCache
+import bcrypt
+import orjson
 
 from .config import settings
 from .exceptions import AuthenticationError
 
 
+# Length, uppercase, lowercase and digit requirements checked in a single match.
+# It is exact for ASCII; other passwords fall back to the str.is* checks.
+_PW_RE = re.compile(r"^(?=.*[A-Z])(?=.*[a-z])(?=.*\d).{8,}$", re.DOTALL)
+
+# Authenticated user context extracted from a verified token
+UserCtx = namedtuple("UserCtx", ["user_id", "email", "role"])
+
+
+# Verified JWT payloads keyed by a truncated token digest. Entries live at most
+# JWT_CACHE_TTL seconds and never past the token's own ``exp``.
+JWT_CACHE_TTL = 30
+
+# Refresh tokens are valid for 30 days
+REFRESH_TOKEN_SECONDS = 30 * 24 * 60 * 60
+_jwt_cache: TTLCache = TTLCache(maxsize=10000, ttl=JWT_CACHE_TTL)
+_jwt_cache_lock = threading.Lock()
+
+# Bcrypt is CPU-bound, so it runs in worker processes instead of on the event
+# loop. The semaphore bounds how many hashes may be queued at once.
+# BCRYPT_WORKERS overrides the pool size (defaults to one worker per CPU).
+_BCRYPT_WORKERS = settings.bcrypt_workers or os.cpu_count() or 1
+# Both are created on first use: the pool is started by the app's startup hook
+# (or lazily by scripts), and the semaphore is rebuilt for each event loop.
+_bcrypt_pool: Optional[ProcessPoolExecutor] = None
+_bcrypt_pool_lock = threading.Lock()
+_bcrypt_sem: Optional[asyncio.Semaphore] = None
+_bcrypt_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def start_bcrypt_pool() -> ProcessPoolExecutor:
+    """Return the bcrypt worker pool, creating it if needed."""
+    global _bcrypt_pool
+    with _bcrypt_pool_lock:
+        if _bcrypt_pool is None:
+            _bcrypt_pool = ProcessPoolExecutor(max_workers=_BCRYPT_WORKERS)
+        return _bcrypt_pool
+
+
+def shutdown_bcrypt_pool() -> None:
+    """Stop the bcrypt worker processes if the pool was started."""
+    global _bcrypt_pool
+    with _bcrypt_pool_lock:
+        pool, _bcrypt_pool = _bcrypt_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _get_bcrypt_sem(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    """Return the queueing semaphore for the running event loop."""
+    global _bcrypt_sem, _bcrypt_sem_loop
+    if _bcrypt_sem is None or _bcrypt_sem_loop is not loop:
+        _bcrypt_sem = asyncio.Semaphore(_BCRYPT_WORKERS * 2)
+        _bcrypt_sem_loop = loop
+    return _bcrypt_sem
+
+
+def _truncate_password(password: str) -> str:
+    """Truncate password to bcrypt's 72-byte limit."""
+    # ASCII passwords have one byte per character, so skip the encode
+    if password.isascii():
+        if len(password) > 72:
+            password = password[:72]
+    else:
+        password_bytes = password.encode('utf-8')
+        if len(password_bytes) > 72:
+            password = password_bytes[:72].decode('utf-8', 'ignore')
+    return password
+
+
+def _do_hash(password: str) -> str:
+    """Hash a password (runs in a bcrypt worker process)."""
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(_truncate_password(password).encode('utf-8'), salt).decode('ascii')
+
+
+def _do_verify(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password (runs in a bcrypt worker process)."""
+    return bcrypt.checkpw(
+        _truncate_password(plain_password).encode('utf-8'),
+        hashed_password.encode('ascii')
+    )
+
+
 class SecurityUtils:
     """Security utilities for password hashing and JWT tokens."""
     
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         self.algorithm = settings.jwt_algorithm
         self.secret_key = settings.jwt_secret
         self.expire_minutes = settings.jwt_expire_minutes
+        self.expire_seconds = self.expire_minutes * 60
+        self.use_jwt_cache = settings.auth_jwt_cache
     
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Hash a password using bcrypt."""
-        # Bcrypt has a 72-byte limit, truncate if necessary
-        if len(password.encode('utf-8')) > 72:
-            password = password[:72]
-        return self.pwd_context.hash(password)
+        loop = asyncio.get_running_loop()
+        async with _get_bcrypt_sem(loop):
+            return await loop.run_in_executor(start_bcrypt_pool(), _do_hash, password)
     
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
-        # Bcrypt has a 72-byte limit, truncate if necessary
-        if len(plain_password.encode('utf-8')) > 72:
-            plain_password = plain_password[:72]
-        return self.pwd_context.verify(plain_password, hashed_password)
+        loop = asyncio.get_running_loop()
+        async with _get_bcrypt_sem(loop):
+            return await loop.run_in_executor(
+                start_bcrypt_pool(), _do_verify, plain_password, hashed_password
+            )
     
     def create_access_token(
         self, 
@@ -41,45 +136,85 @@ class SecurityUtils:
         expires_delta: Optional[timedelta] = None
     ) -> str:
         """Create a JWT access token."""
-        to_encode = data.copy()
-        
+        now = int(time.time())
         if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
+            expire = now + int(expires_delta.total_seconds())
         else:
-            expire = datetime.now(timezone.utc) + timedelta(minutes=self.expire_minutes)
+            expire = now + self.expire_seconds
         
-        to_encode.update({
-            "exp": expire,
-            "iat": datetime.now(timezone.utc),
-            "type": "access"
-        })
+        to_encode = {**data, "exp": expire, "iat": now, "type": "access"}
         
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
     
     def create_refresh_token(self, data: Dict[str, Any]) -> str:
         """Create a JWT refresh token (longer expiry)."""
-        to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + timedelta(days=30)  # 30 days for refresh
+        now = int(time.time())
+        expire = now + REFRESH_TOKEN_SECONDS
         
-        to_encode.update({
-            "exp": expire,
-            "iat": datetime.now(timezone.utc),
-            "type": "refresh"
-        })
+        to_encode = {**data, "exp": expire, "iat": now, "type": "refresh"}
         
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
     
-    def verify_token(self, token: str) -> Dict[str, Any]:
-        """Verify and decode JWT token."""
+    def _has_jwt_shape(self, token: str) -> bool:
+        """Cheap structural check run before any signature verification."""
+        if token.count(".") != 2:
+            return False
+        header_b64 = token.split(".", 1)[0]
+        padded = header_b64 + "=" * (-len(header_b64) % 4)
+        try:
+            header = orjson.loads(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, ValueError):
+            return False
+        return isinstance(header, dict) and header.get("alg") == self.algorithm
+    
+    def _verify_cached(self, token: str) -> Tuple[float, Dict[str, Any], UserCtx]:
+        """Verify a token, returning its cache entry (expires_at, payload, user)."""
+        key = hashlib.sha256(token.encode()).digest()[:16]
+        now = time.time()
+        
+        if self.use_jwt_cache:
+            with _jwt_cache_lock:
+                cached = _jwt_cache.get(key)
+            if cached is not None and cached[0] > now:
+                return cached
+        
+        if not self._has_jwt_shape(token):
+            raise AuthenticationError("Invalid token")
+        
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
         except jwt.ExpiredSignatureError:
+            with _jwt_cache_lock:
+                _jwt_cache.pop(key, None)
             raise AuthenticationError("Token has expired")
-        except jwt.JWTError:
+        except jwt.InvalidTokenError:
             raise AuthenticationError("Invalid token")
+        
+        # Cap the cached lifetime so revocation lag stays bounded
+        expires_at = min(payload.get("exp", now), now + JWT_CACHE_TTL)
+        entry = (
+            expires_at,
+            payload,
+            UserCtx(payload.get("sub"), payload.get("email"), payload.get("role"))
+        )
+        if self.use_jwt_cache and expires_at > now:
+            with _jwt_cache_lock:
+                _jwt_cache[key] = entry
+        
+        return entry
+    
+    def verify_token(self, token: str) -> Dict[str, Any]:
+        """Verify and decode JWT token."""
+        return self._verify_cached(token)[1]
+    
+    def authenticate(self, token: str) -> UserCtx:
+        """Verify a token and return the authenticated user context."""
+        user = self._verify_cached(token)[2]
+        if not user.user_id:
+            raise AuthenticationError("Invalid token payload")
+        return user
     
     def decode_token(self, token: str) -> Dict[str, Any]:
         """Decode token without verification (for debugging)."""
@@ -95,14 +230,17 @@ security = SecurityUtils()
 
 def validate_password_strength(password: str) -> bool:
     """Validate password strength requirements."""
-    if len(password) < 8:
+    if _PW_RE.match(password):
+        return True
+    if password.isascii():
         return False
-    
-    has_upper = any(c.isupper() for c in password)
-    has_lower = any(c.islower() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    
-    return has_upper and has_lower and has_digit
+    # Non-ASCII letters and digits count, as with str.isupper()/islower()/isdigit()
+    return (
+        len(password) >= 8
+        and any(c.isupper() for c in password)
+        and any(c.islower() for c in password)
+        and any(c.isdigit() for c in password)
+    )
 
 
 def generate_user_token_data(user_id: str, email: str, role: str) -> Dict[str, Any]:
@@ -114,11 +252,3 @@ def generate_user_token_data(user_id: str, email: str, role: str) -> Dict[str, A
         "scope": "access"
     }
 
-
-def extract_user_from_token(token_data: Dict[str, Any]) -> Dict[str, str]:
-    """Extract user information from token payload."""
-    return {
-        "user_id": token_data.get("sub"),
-        "email": token_data.get("email"),
-        "role": token_data.get("role")
-    }
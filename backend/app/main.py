@@ -10,7 +10,11 @@ import uvicorn
 import logging
 
 from app.core.config import settings
-from app.core.exceptions import AppException
+from app.core.exceptions import AppException, AuthenticationError
+from app.core.dependencies import AuthASGIMiddleware
+from app.core.responses import ORJSONResponse
+from app.core.security import start_bcrypt_pool, shutdown_bcrypt_pool
+from app.repositories.user_repository import UserRepository, close_mongo_client
 from app.core.logging import setup_logging
 
 # Setup logging
@@ -24,6 +28,7 @@ app = FastAPI(
     description="AI-Powered Legal Assistant with RAG capabilities",
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -35,6 +40,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Resolve bearer tokens once per request before routing
+app.add_middleware(AuthASGIMiddleware)
+
 # Add trusted host middleware in production
 if settings.is_production:
     app.add_middleware(
@@ -46,9 +54,11 @@ if settings.is_production:
 @app.exception_handler(AppException)
 async def app_exception_handler(request: Request, exc: AppException):
     """Handle custom application exceptions."""
+    headers = {"WWW-Authenticate": "Bearer"} if isinstance(exc, AuthenticationError) else None
     return JSONResponse(
         status_code=exc.status_code,
-        content={"error": exc.error_code, "message": exc.message, "details": exc.details}
+        content={"error": exc.error_code, "message": exc.message, "details": exc.details},
+        headers=headers
     )
 
 
@@ -62,6 +72,40 @@ async def internal_server_error_handler(request: Request, exc: Exception):
     )
 
 
+@app.on_event("startup")
+async def create_indexes():
+    """Make sure MongoDB indexes exist before serving traffic."""
+    user_repo = UserRepository()
+    # Registration relies on the unique email index, so startup fails without it
+    try:
+        await user_repo.ensure_email_index()
+    except Exception as e:
+        logger.error(f"Could not create the unique users.email index: {e}")
+        raise
+    try:
+        await user_repo.ensure_secondary_indexes()
+    except Exception as e:
+        logger.warning(f"Could not create MongoDB indexes: {e}")
+
+
+@app.on_event("startup")
+async def start_password_workers():
+    """Spawn the bcrypt worker processes before the first login."""
+    start_bcrypt_pool()
+
+
+@app.on_event("shutdown")
+async def close_database():
+    """Release the shared MongoDB connection pool."""
+    close_mongo_client()
+
+
+@app.on_event("shutdown")
+async def stop_password_workers():
+    """Stop the bcrypt worker processes."""
+    shutdown_bcrypt_pool()
+
+
 @app.get("/")
 async def root():
     """Root endpoint - health check."""
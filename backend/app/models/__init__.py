@@ -2,7 +2,7 @@
 Database models for EasyLaw application.
 """
 
-from .user import User, UserInDB, UserRole, UserStatus, PyObjectId
+from .user import User, UserInDB, UserRole, UserStatus, ObjectIdStr
 from .session import Session, SessionInDB, SessionMode, SessionStatus
 from .message import Message, MessageInDB, MessageSender
 from .admin_log import AdminLog, AdminLogInDB, AdminAction
@@ -22,5 +22,5 @@ __all__ = [
     "AdminLog",
     "AdminLogInDB",
     "AdminAction",
-    "PyObjectId"
+    "ObjectIdStr"
 ]
@@ -5,10 +5,9 @@ Admin log model for MongoDB.
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
-from bson import ObjectId
+from pydantic import BaseModel, ConfigDict, Field
 
-from .user import PyObjectId
+from .user import ObjectIdStr, new_object_id
 
 
 class AdminAction(str, Enum):
@@ -28,8 +27,8 @@ class AdminAction(str, Enum):
 class AdminLog(BaseModel):
     """Admin action log model."""
     
-    id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
-    admin_id: PyObjectId = Field(..., description="Reference to admin user")
+    id: Optional[ObjectIdStr] = Field(default_factory=new_object_id, alias="_id")
+    admin_id: ObjectIdStr = Field(..., description="Reference to admin user")
     action: AdminAction = Field(..., description="Admin action performed")
     params: Dict[str, Any] = Field(default_factory=dict, description="Action parameters")
     result: Dict[str, Any] = Field(default_factory=dict, description="Action result")
@@ -38,11 +37,12 @@ class AdminLog(BaseModel):
     execution_time: Optional[float] = Field(None, description="Execution time in seconds")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        extra='ignore',
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "admin_id": "507f1f77bcf86cd799439011",
                 "action": "crawl_laws",
@@ -59,6 +59,7 @@ class AdminLog(BaseModel):
                 "execution_time": 45.2
             }
         }
+    )
     
     def is_successful(self) -> bool:
         """Check if admin action was successful."""
@@ -5,10 +5,9 @@ Chat message model for MongoDB.
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
-from bson import ObjectId
+from pydantic import BaseModel, ConfigDict, Field
 
-from .user import PyObjectId
+from .user import ObjectIdStr, new_object_id
 
 
 class MessageSender(str, Enum):
@@ -18,22 +17,29 @@ class MessageSender(str, Enum):
     SYSTEM = "system"
 
 
+# Plain string values for cheap comparisons
+_USER = MessageSender.USER.value
+_ASSISTANT = MessageSender.ASSISTANT.value
+_SYSTEM = MessageSender.SYSTEM.value
+
+
 class Message(BaseModel):
     """Chat message model."""
     
-    id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
-    session_id: PyObjectId = Field(..., description="Reference to chat session")
+    id: Optional[ObjectIdStr] = Field(default_factory=new_object_id, alias="_id")
+    session_id: ObjectIdStr = Field(..., description="Reference to chat session")
     sender: MessageSender = Field(..., description="Message sender")
     content: str = Field(..., description="Message content")
     tokens: int = Field(default=0, description="Token count for this message")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        extra='ignore',
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "session_id": "507f1f77bcf86cd799439011",
                 "sender": "user",
@@ -45,27 +51,28 @@ class Message(BaseModel):
                 }
             }
         }
+    )
     
     def is_from_user(self) -> bool:
         """Check if message is from user."""
-        return self.sender == MessageSender.USER
+        return self.sender == _USER
     
     def is_from_assistant(self) -> bool:
         """Check if message is from assistant."""
-        return self.sender == MessageSender.ASSISTANT
+        return self.sender == _ASSISTANT
     
     def is_system_message(self) -> bool:
         """Check if message is system message."""
-        return self.sender == MessageSender.SYSTEM
+        return self.sender == _SYSTEM
 
 
 class MessageInDB(Message):
     """Message model with additional database fields."""
     
     # RAG-specific fields
-    rag_sources: Optional[list] = Field(default_factory=list, description="RAG source documents")
+    rag_sources: Optional[list] = Field(None, description="RAG source documents")
     embedding_id: Optional[str] = Field(None, description="Reference to vector embedding")
-    similarity_scores: Optional[Dict[str, float]] = Field(default_factory=dict)
+    similarity_scores: Optional[Dict[str, float]] = None
     
     # Performance metrics
     response_time: Optional[float] = Field(None, description="Response generation time in seconds")
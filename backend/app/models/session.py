@@ -5,10 +5,9 @@ Chat session model for MongoDB.
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field
-from bson import ObjectId
+from pydantic import BaseModel, ConfigDict, Field
 
-from .user import PyObjectId
+from .user import ObjectIdStr, new_object_id
 
 
 class SessionMode(str, Enum):
@@ -23,11 +22,15 @@ class SessionStatus(str, Enum):
     CLOSED = "closed"
 
 
+# Plain string value for cheap comparisons
+_ACTIVE = SessionStatus.ACTIVE.value
+
+
 class Session(BaseModel):
     """Chat session model."""
     
-    id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
-    user_id: PyObjectId = Field(..., description="Reference to user")
+    id: Optional[ObjectIdStr] = Field(default_factory=new_object_id, alias="_id")
+    user_id: ObjectIdStr = Field(..., description="Reference to user")
     mode: SessionMode = Field(..., description="Session mode (public/internal laws)")
     status: SessionStatus = Field(default=SessionStatus.ACTIVE, description="Session status")
     title: Optional[str] = Field(None, description="Session title (auto-generated from first message)")
@@ -35,11 +38,12 @@ class Session(BaseModel):
     closed_at: Optional[datetime] = None
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        extra='ignore',
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "user_id": "507f1f77bcf86cd799439011",
                 "mode": "laws_public",
@@ -47,10 +51,11 @@ class Session(BaseModel):
                 "title": "Consultation about labor law"
             }
         }
+    )
     
     def is_active(self) -> bool:
         """Check if session is active."""
-        return self.status == SessionStatus.ACTIVE
+        return self.status == _ACTIVE
     
     def close_session(self) -> None:
         """Close the session."""
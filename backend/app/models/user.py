@@ -4,8 +4,8 @@ User model for MongoDB.
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field, EmailStr
+from typing import Annotated, Any, Optional
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field, EmailStr
 from bson import ObjectId
 
 
@@ -21,57 +21,57 @@ class UserStatus(str, Enum):
     INACTIVE = "inactive"
 
 
-class PyObjectId(ObjectId):
-    """Custom ObjectId type for Pydantic v2."""
-    
-    @classmethod
-    def __get_pydantic_core_schema__(cls, source_type, handler):
-        from pydantic_core import core_schema
-        return core_schema.json_or_python_schema(
-            json_schema=core_schema.str_schema(),
-            python_schema=core_schema.union_schema([
-                core_schema.is_instance_schema(ObjectId),
-                core_schema.chain_schema([
-                    core_schema.str_schema(),
-                    core_schema.no_info_plain_validator_function(cls.validate),
-                ])
-            ]),
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                str, when_used='json'
-            ),
-        )
-    
-    @classmethod
-    def validate(cls, v):
-        if isinstance(v, ObjectId):
-            return v
-        if isinstance(v, str) and ObjectId.is_valid(v):
-            return ObjectId(v)
+# Plain string values for cheap comparisons (UserRole/UserStatus subclass str)
+_ADMIN = UserRole.ADMIN.value
+_ACTIVE = UserStatus.ACTIVE.value
+
+
+def _oid_to_str(value: Any) -> Any:
+    """Convert ObjectId values coming from MongoDB to their hex string."""
+    return str(value) if isinstance(value, ObjectId) else value
+
+
+def _check_oid(value: str) -> str:
+    """Ensure a string is a valid ObjectId."""
+    if not ObjectId.is_valid(value):
         raise ValueError("Invalid ObjectId")
+    return value
+
+
+def new_object_id() -> str:
+    """Generate a new ObjectId as a string."""
+    return str(ObjectId())
+
+
+# ObjectId stored as a plain string so pydantic-core keeps it a str schema
+ObjectIdStr = Annotated[str, BeforeValidator(_oid_to_str), AfterValidator(_check_oid)]
 
 
 class User(BaseModel):
     """User model."""
     
-    id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
+    id: Optional[ObjectIdStr] = Field(default_factory=new_object_id, alias="_id")
     email: EmailStr = Field(..., description="User email address")
-    password_hash: str = Field(..., description="Hashed password")
+    # None on reads that project the hash out (see UserRepository)
+    password_hash: Optional[str] = Field(default=None, description="Hashed password")
     role: UserRole = Field(default=UserRole.USER, description="User role")
     status: UserStatus = Field(default=UserStatus.ACTIVE, description="User status")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        extra='ignore',
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "role": "user",
                 "status": "active"
             }
         }
+    )
 
 
 class UserInDB(User):
@@ -79,11 +79,13 @@ class UserInDB(User):
     
     last_login: Optional[datetime] = None
     login_count: int = Field(default=0)
+    # ISO creation timestamp, rendered once by UserRepository; not serialized
+    created_at_iso: Optional[str] = Field(default=None, exclude=True)
     
     def is_admin(self) -> bool:
         """Check if user is admin."""
-        return self.role == UserRole.ADMIN
+        return self.role == _ADMIN
     
     def is_active(self) -> bool:
         """Check if user is active."""
-        return self.status == UserStatus.ACTIVE
+        return self.status == _ACTIVE
@@ -2,69 +2,167 @@
 User repository for MongoDB operations.
 """
 
+from functools import lru_cache
 from typing import Optional, List
 from datetime import datetime
 from bson import ObjectId
 import motor.motor_asyncio
+from pymongo import ASCENDING, DESCENDING, IndexModel, WriteConcern
+from pymongo.errors import DuplicateKeyError
 
 from ..models.user import User, UserInDB, UserRole, UserStatus
 from ..core.config import settings
+from ..core.security import security
 from ..core.exceptions import NotFoundError, ConflictError
 
 
+@lru_cache(maxsize=1)
+def get_mongo_client() -> motor.motor_asyncio.AsyncIOMotorClient:
+    """Return the process-wide Motor client (one connection pool per process)."""
+    return motor.motor_asyncio.AsyncIOMotorClient(
+        settings.mongodb_uri,
+        maxPoolSize=settings.mongodb_max_pool_size,
+        minPoolSize=settings.mongodb_min_pool_size
+    )
+
+
+def close_mongo_client() -> None:
+    """Close the shared Motor client if one was created."""
+    if get_mongo_client.cache_info().currsize:
+        get_mongo_client().close()
+        get_mongo_client.cache_clear()
+
+
+# Excluded from every read that does not verify a password; the resulting
+# UserInDB has password_hash=None
+_PUBLIC_PROJECTION = {"password_hash": 0}
+
+
+def _from_doc(doc: dict) -> UserInDB:
+    """Build a UserInDB from a trusted MongoDB document without validation."""
+    doc["id"] = str(doc.pop("_id"))
+    doc["created_at_iso"] = doc["created_at"].isoformat()
+    return UserInDB.model_construct(**doc)
+
+
 class UserRepository:
     """Repository for user data operations."""
     
+    # Set once the unique email index is known to exist in this process;
+    # create_user depends on it to reject duplicate emails
+    _email_index_ready = False
+    
     def __init__(self):
-        self.client = motor.motor_asyncio.AsyncIOMotorClient(settings.mongodb_uri)
+        self.client = get_mongo_client()
         self.database = self.client[settings.mongodb_db_name]
         self.collection = self.database.users
+        # Unacknowledged writes for bulk seeding/imports only
+        self.fast_collection = self.collection.with_options(write_concern=WriteConcern(w=0))
+    
+    async def ping(self) -> None:
+        """Round-trip to MongoDB so the connection pool is established."""
+        await self.database.command("ping")
+    
+    async def ensure_email_index(self) -> None:
+        """Create the unique email index that create_user relies on (idempotent).
+        
+        Raises if it cannot be built, e.g. when duplicate emails already exist.
+        """
+        await self.collection.create_index([("email", ASCENDING)], unique=True)
+        UserRepository._email_index_ready = True
+    
+    async def ensure_secondary_indexes(self) -> None:
+        """Create the query-only indexes (idempotent; safe to skip on failure)."""
+        await self.collection.create_indexes([
+            IndexModel([("status", ASCENDING), ("created_at", DESCENDING)]),
+            IndexModel([("role", ASCENDING)])
+        ])
+    
+    async def ensure_indexes(self) -> None:
+        """Create all indexes used by user queries (idempotent)."""
+        await self.ensure_email_index()
+        await self.ensure_secondary_indexes()
     
     async def create_user(self, user_data: dict) -> UserInDB:
         """Create a new user."""
-        # Check if user already exists
-        existing_user = await self.get_user_by_email(user_data["email"])
-        if existing_user:
-            raise ConflictError(f"User with email {user_data['email']} already exists")
-        
         # Prepare user document
+        now = datetime.utcnow()
         user_doc = {
             "email": user_data["email"],
             "password_hash": user_data["password_hash"],
             "role": user_data.get("role", UserRole.USER.value),
             "status": user_data.get("status", UserStatus.ACTIVE.value),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
+            "created_at": now,
+            "updated_at": now,
             "last_login": None,
             "login_count": 0
         }
         
-        # Insert user
-        result = await self.collection.insert_one(user_doc)
+        # Insert user; the unique email index rejects duplicates atomically.
+        # Entry points that skip the app's startup hook build it here, once.
+        if not self._email_index_ready:
+            await self.ensure_email_index()
+        try:
+            result = await self.collection.insert_one(user_doc)
+        except DuplicateKeyError:
+            raise ConflictError(f"User with email {user_data['email']} already exists")
         user_doc["_id"] = result.inserted_id
         
-        return UserInDB(**user_doc)
+        return _from_doc(user_doc)
+    
+    async def bulk_create_users(self, user_docs: List[dict]) -> None:
+        """Insert many prepared user documents without waiting for acks.
+        
+        Intended for seeding and imports. Writes are unacknowledged, so
+        nothing is returned: duplicates rejected by the email index and other
+        write errors are dropped silently. Use create_user for sign-ups.
+        """
+        if not user_docs:
+            return
+        if not self._email_index_ready:
+            await self.ensure_email_index()
+        await self.fast_collection.insert_many(user_docs, ordered=False)
     
     async def get_user_by_id(self, user_id: str) -> Optional[UserInDB]:
-        """Get user by ID."""
+        """Get user by ID (without password hash)."""
         try:
             object_id = ObjectId(user_id)
-            user_doc = await self.collection.find_one({"_id": object_id})
+            user_doc = await self.collection.find_one({"_id": object_id}, _PUBLIC_PROJECTION)
             
             if user_doc:
-                return UserInDB(**user_doc)
+                return _from_doc(user_doc)
             return None
         except Exception:
             return None
     
     async def get_user_by_email(self, email: str) -> Optional[UserInDB]:
-        """Get user by email."""
+        """Get user by email (without password hash)."""
+        user_doc = await self.collection.find_one({"email": email}, _PUBLIC_PROJECTION)
+        
+        if user_doc:
+            return _from_doc(user_doc)
+        return None
+    
+    async def get_user_for_auth(self, email: str) -> Optional[UserInDB]:
+        """Get user by email, including the password hash for verification."""
         user_doc = await self.collection.find_one({"email": email})
         
         if user_doc:
-            return UserInDB(**user_doc)
+            return _from_doc(user_doc)
         return None
     
+    async def get_user_for_auth_by_id(self, user_id: str) -> Optional[UserInDB]:
+        """Get user by ID, including the password hash for verification."""
+        try:
+            object_id = ObjectId(user_id)
+            user_doc = await self.collection.find_one({"_id": object_id})
+            
+            if user_doc:
+                return _from_doc(user_doc)
+            return None
+        except Exception:
+            return None
+    
     async def update_user(self, user_id: str, update_data: dict) -> Optional[UserInDB]:
         """Update user information."""
         try:
@@ -77,11 +175,12 @@ class UserRepository:
             result = await self.collection.find_one_and_update(
                 {"_id": object_id},
                 {"$set": update_data},
+                projection=_PUBLIC_PROJECTION,
                 return_document=True
             )
             
             if result:
-                return UserInDB(**result)
+                return _from_doc(result)
             return None
         except Exception:
             return None
@@ -90,13 +189,14 @@ class UserRepository:
         """Update user's last login timestamp."""
         try:
             object_id = ObjectId(user_id)
+            now = datetime.utcnow()
             
             result = await self.collection.update_one(
                 {"_id": object_id},
                 {
                     "$set": {
-                        "last_login": datetime.utcnow(),
-                        "updated_at": datetime.utcnow()
+                        "last_login": now,
+                        "updated_at": now
                     },
                     "$inc": {"login_count": 1}
                 }
@@ -106,20 +206,32 @@ class UserRepository:
         except Exception:
             return False
     
+    async def _update(self, user_id: str, patch: dict) -> int:
+        """Apply a $set patch without reading the document back.
+        
+        Returns the number of modified documents; invalid IDs and database
+        errors count as 0, as update_user returns None for them.
+        """
+        try:
+            object_id = ObjectId(user_id)
+            
+            patch["updated_at"] = datetime.utcnow()
+            result = await self.collection.update_one({"_id": object_id}, {"$set": patch})
+            return result.modified_count
+        except Exception:
+            return 0
+    
     async def deactivate_user(self, user_id: str) -> bool:
         """Deactivate a user account."""
-        result = await self.update_user(user_id, {"status": UserStatus.INACTIVE.value})
-        return result is not None
+        return await self._update(user_id, {"status": UserStatus.INACTIVE.value}) > 0
     
     async def activate_user(self, user_id: str) -> bool:
         """Activate a user account."""
-        result = await self.update_user(user_id, {"status": UserStatus.ACTIVE.value})
-        return result is not None
+        return await self._update(user_id, {"status": UserStatus.ACTIVE.value}) > 0
     
     async def change_password(self, user_id: str, new_password_hash: str) -> bool:
         """Change user password."""
-        result = await self.update_user(user_id, {"password_hash": new_password_hash})
-        return result is not None
+        return await self._update(user_id, {"password_hash": new_password_hash}) > 0
     
     async def get_all_users(
         self, 
@@ -132,13 +244,8 @@ class UserRepository:
         if status_filter:
             query["status"] = status_filter
         
-        cursor = self.collection.find(query).skip(skip).limit(limit).sort("created_at", -1)
-        users = []
-        
-        async for user_doc in cursor:
-            users.append(UserInDB(**user_doc))
-        
-        return users
+        cursor = self.collection.find(query, _PUBLIC_PROJECTION).skip(skip).limit(limit).sort("created_at", -1)
+        return [_from_doc(user_doc) for user_doc in await cursor.to_list(length=limit)]
     
     async def get_user_count(self, status_filter: Optional[str] = None) -> int:
         """Get total user count."""
@@ -159,13 +266,8 @@ class UserRepository:
     
     async def get_admin_users(self) -> List[UserInDB]:
         """Get all admin users."""
-        cursor = self.collection.find({"role": UserRole.ADMIN.value})
-        admins = []
-        
-        async for user_doc in cursor:
-            admins.append(UserInDB(**user_doc))
-        
-        return admins
+        cursor = self.collection.find({"role": UserRole.ADMIN.value}, _PUBLIC_PROJECTION)
+        return [_from_doc(user_doc) for user_doc in await cursor.to_list(length=None)]
     
     async def create_admin_user(self, email: str, password_hash: str) -> UserInDB:
         """Create admin user."""
@@ -185,9 +287,8 @@ class UserRepository:
         
         if not admin_user:
             # Create default admin user
-            from ..core.security import security
             default_password = "Admin@12345"
-            password_hash = security.hash_password(default_password)
+            password_hash = await security.hash_password(default_password)
             
             admin_user = await self.create_admin_user(admin_email, password_hash)
         
@@ -200,9 +301,8 @@ class UserRepository:
         
         if not demo_user:
             # Create default demo user
-            from ..core.security import security
             default_password = "User@12345"
-            password_hash = security.hash_password(default_password)
+            password_hash = await security.hash_password(default_password)
             
             user_data = {
                 "email": user_email,
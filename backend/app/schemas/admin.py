@@ -2,35 +2,34 @@
 Admin schemas for API validation.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import List, Literal, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from app.models.admin_log import AdminAction
 
 
+# Law types are checked natively by pydantic-core via Literal
+LawType = Literal["enterprises", "labor", "all"]
+
+_VALID_ACTIONS = frozenset({"activate", "deactivate", "query", "delete"})
+
+
 class CrawlLawsRequest(BaseModel):
     """Crawl laws request schema."""
     
-    law_types: List[str] = Field(
+    law_types: List[LawType] = Field(
         default=["enterprises", "labor"], 
         description="Types of laws to crawl"
     )
     force_update: bool = Field(default=False, description="Force re-crawl existing laws")
     
-    @validator('law_types')
-    def validate_law_types(cls, v):
-        valid_types = ["enterprises", "labor", "all"]
-        for law_type in v:
-            if law_type not in valid_types:
-                raise ValueError(f'Invalid law type: {law_type}. Valid types: {valid_types}')
-        return v
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "law_types": ["enterprises", "labor"],
                 "force_update": False
             }
         }
+    )
 
 
 class UploadLawsRequest(BaseModel):
@@ -41,8 +40,8 @@ class UploadLawsRequest(BaseModel):
     description: Optional[str] = Field(None, max_length=500, description="File description")
     category: Optional[str] = Field(None, description="Law category")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "file_name": "company_internal_policy.pdf",
                 "file_type": "PDF",
@@ -50,6 +49,7 @@ class UploadLawsRequest(BaseModel):
                 "category": "internal_policies"
             }
         }
+    )
 
 
 class AdminAgentCommand(BaseModel):
@@ -58,19 +58,21 @@ class AdminAgentCommand(BaseModel):
     command: str = Field(..., min_length=1, max_length=1000, description="Admin command")
     context: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Command context")
     
-    @validator('command')
+    @field_validator('command')
+    @classmethod
     def validate_command(cls, v):
         if not v.strip():
             raise ValueError('Command cannot be empty')
         return v.strip()
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "command": "Generate statistics for this month",
                 "context": {"format": "excel"}
             }
         }
+    )
 
 
 class AdminAgentResponse(BaseModel):
@@ -81,8 +83,8 @@ class AdminAgentResponse(BaseModel):
     data: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Response data")
     success: bool = Field(..., description="Command success status")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "response": "Statistics report generated successfully for January 2024",
                 "action_taken": "generate_report",
@@ -94,6 +96,7 @@ class AdminAgentResponse(BaseModel):
                 "success": True
             }
         }
+    )
 
 
 class UserManagementRequest(BaseModel):
@@ -103,21 +106,22 @@ class UserManagementRequest(BaseModel):
     action: str = Field(..., description="Action to perform")
     reason: Optional[str] = Field(None, description="Action reason")
     
-    @validator('action')
+    @field_validator('action')
+    @classmethod
     def validate_action(cls, v):
-        valid_actions = ["activate", "deactivate", "query", "delete"]
-        if v not in valid_actions:
-            raise ValueError(f'Invalid action: {v}. Valid actions: {valid_actions}')
+        if v not in _VALID_ACTIONS:
+            raise ValueError(f'Invalid action: {v}. Valid actions: {sorted(_VALID_ACTIONS)}')
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "action": "deactivate",
                 "reason": "Violation of terms of service"
             }
         }
+    )
 
 
 class AdminStatsResponse(BaseModel):
@@ -132,8 +136,8 @@ class AdminStatsResponse(BaseModel):
     seven_day_activity: List[Dict[str, Any]] = Field(..., description="7-day activity data")
     storage_stats: Dict[str, Any] = Field(..., description="Storage statistics")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_users": 150,
                 "active_users": 120,
@@ -152,6 +156,7 @@ class AdminStatsResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class AdminLogResponse(BaseModel):
@@ -166,8 +171,8 @@ class AdminLogResponse(BaseModel):
     execution_time: Optional[float] = Field(None, description="Execution time")
     created_at: str = Field(..., description="Creation timestamp")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "507f1f77bcf86cd799439013",
                 "admin_email": "admin@example.com",
@@ -179,3 +184,4 @@ class AdminLogResponse(BaseModel):
                 "created_at": "2024-01-01T12:00:00Z"
             }
         }
+    )
@@ -2,11 +2,36 @@
 Authentication schemas for API validation.
 """
 
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, validator
+import re
+from typing import Annotated, Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, Field, ValidationInfo, field_validator
+from pydantic.networks import validate_email
 from app.models.user import UserRole, UserStatus
 
 
+# Uppercase, lowercase and digit requirements checked in a single match
+# (ASCII only; the validator falls back to str.is* checks when it fails)
+_PW_RE = re.compile(r"^(?=.*[A-Z])(?=.*[a-z])(?=.*\d).+$", re.DOTALL)
+
+# Shape-only email check; full EmailStr validation runs once, at registration.
+# Lookups still normalize like EmailStr so they match the stored address.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _check_email(v: str) -> str:
+    """Normalize an email to the same key EmailStr stores at registration."""
+    if not _EMAIL_RE.match(v):
+        raise ValueError('value is not a valid email address')
+    # Internationalized addresses need the full IDNA/NFC normalization
+    if not v.isascii():
+        return validate_email(v)[1]
+    local, _, domain = v.rpartition('@')
+    return f"{local}@{domain.lower()}"
+
+
+CheapEmail = Annotated[str, AfterValidator(_check_email)]
+
+
 class UserRegistration(BaseModel):
     """User registration schema."""
     
@@ -14,15 +39,20 @@ class UserRegistration(BaseModel):
     password: str = Field(..., min_length=8, max_length=100, description="User password")
     confirm_password: str = Field(..., description="Password confirmation")
     
-    @validator('confirm_password')
-    def passwords_match(cls, v, values):
-        if 'password' in values and v != values['password']:
+    @field_validator('confirm_password')
+    @classmethod
+    def passwords_match(cls, v, info: ValidationInfo):
+        if 'password' in info.data and v != info.data['password']:
             raise ValueError('Passwords do not match')
         return v
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         # Add password strength validation
+        if _PW_RE.match(v):
+            return v
+        # Slow path: non-ASCII passwords, or reporting which requirement failed
         if not any(c.isupper() for c in v):
             raise ValueError('Password must contain at least one uppercase letter')
         if not any(c.islower() for c in v):
@@ -31,44 +61,46 @@ class UserRegistration(BaseModel):
             raise ValueError('Password must contain at least one digit')
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "password": "StrongPass123",
                 "confirm_password": "StrongPass123"
             }
         }
+    )
 
 
 class UserLogin(BaseModel):
     """User login schema."""
     
-    email: EmailStr = Field(..., description="User email address")
+    email: CheapEmail = Field(..., description="User email address")
     password: str = Field(..., description="User password")
     remember_me: bool = Field(default=False, description="Extended session duration")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "password": "StrongPass123",
                 "remember_me": False
             }
         }
+    )
 
 
 class UserResponse(BaseModel):
     """User response schema."""
     
     id: str = Field(..., description="User ID")
-    email: EmailStr = Field(..., description="User email")
+    email: CheapEmail = Field(..., description="User email")
     role: UserRole = Field(..., description="User role")
     status: UserStatus = Field(..., description="User status")
     created_at: str = Field(..., description="Creation timestamp")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "507f1f77bcf86cd799439011",
                 "email": "user@example.com",
@@ -77,6 +109,7 @@ class UserResponse(BaseModel):
                 "created_at": "2024-01-01T12:00:00Z"
             }
         }
+    )
 
 
 class TokenResponse(BaseModel):
@@ -87,8 +120,8 @@ class TokenResponse(BaseModel):
     expires_in: int = Field(..., description="Token expiration time in seconds")
     user: UserResponse = Field(..., description="User information")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIs...",
                 "token_type": "bearer",
@@ -102,19 +135,21 @@ class TokenResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class PasswordReset(BaseModel):
     """Password reset request schema."""
     
-    email: EmailStr = Field(..., description="User email address")
+    email: CheapEmail = Field(..., description="User email address")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com"
             }
         }
+    )
 
 
 class PasswordChange(BaseModel):
@@ -124,17 +159,19 @@ class PasswordChange(BaseModel):
     new_password: str = Field(..., min_length=8, max_length=100, description="New password")
     confirm_password: str = Field(..., description="New password confirmation")
     
-    @validator('confirm_password')
-    def passwords_match(cls, v, values):
-        if 'new_password' in values and v != values['new_password']:
+    @field_validator('confirm_password')
+    @classmethod
+    def passwords_match(cls, v, info: ValidationInfo):
+        if 'new_password' in info.data and v != info.data['new_password']:
             raise ValueError('Passwords do not match')
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "current_password": "OldPass123",
                 "new_password": "NewStrongPass456",
                 "confirm_password": "NewStrongPass456"
             }
         }
+    )
@@ -2,25 +2,21 @@
 Chat schemas for API validation.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 from app.models.session import SessionMode, SessionStatus
 from app.models.message import MessageSender
 
 
+# Stripped and length-checked inside pydantic-core
+MessageContent = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=4000)]
+
+
 class SessionCreate(BaseModel):
     """Create new chat session schema."""
     
     mode: SessionMode = Field(..., description="Session mode (public/internal laws)")
     title: Optional[str] = Field(None, max_length=200, description="Optional session title")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "mode": "laws_public",
-                "title": "Labor law consultation"
-            }
-        }
 
 
 class SessionResponse(BaseModel):
@@ -34,39 +30,14 @@ class SessionResponse(BaseModel):
     created_at: str = Field(..., description="Creation timestamp")
     updated_at: str = Field(..., description="Last update timestamp")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "507f1f77bcf86cd799439011",
-                "mode": "laws_public",
-                "status": "active",
-                "title": "Labor law consultation",
-                "message_count": 5,
-                "created_at": "2024-01-01T12:00:00Z",
-                "updated_at": "2024-01-01T12:15:00Z"
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
 
 
 class MessageCreate(BaseModel):
     """Create new message schema."""
     
-    content: str = Field(..., min_length=1, max_length=4000, description="Message content")
+    content: MessageContent = Field(..., description="Message content")
     session_id: str = Field(..., description="Target session ID")
-    
-    @validator('content')
-    def validate_content(cls, v):
-        if not v.strip():
-            raise ValueError('Message content cannot be empty')
-        return v.strip()
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "content": "What are the requirements for establishing a company in Vietnam?",
-                "session_id": "507f1f77bcf86cd799439011"
-            }
-        }
 
 
 class MessageResponse(BaseModel):
@@ -80,21 +51,7 @@ class MessageResponse(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     created_at: str = Field(..., description="Creation timestamp")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "507f1f77bcf86cd799439012",
-                "session_id": "507f1f77bcf86cd799439011",
-                "sender": "assistant",
-                "content": "To establish a company in Vietnam, you need to follow these steps...",
-                "tokens": 45,
-                "metadata": {
-                    "rag_sources": ["Law on Enterprises 2020"],
-                    "response_time": 1.2
-                },
-                "created_at": "2024-01-01T12:10:00Z"
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
 
 
 class ChatHistoryResponse(BaseModel):
@@ -104,22 +61,7 @@ class ChatHistoryResponse(BaseModel):
     messages: List[MessageResponse] = Field(..., description="Chat messages")
     total_messages: int = Field(..., description="Total message count")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "session": {
-                    "id": "507f1f77bcf86cd799439011",
-                    "mode": "laws_public",
-                    "status": "active",
-                    "title": "Labor law consultation",
-                    "message_count": 2,
-                    "created_at": "2024-01-01T12:00:00Z",
-                    "updated_at": "2024-01-01T12:10:00Z"
-                },
-                "messages": [],
-                "total_messages": 2
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
 
 
 class SessionsListResponse(BaseModel):
@@ -129,29 +71,18 @@ class SessionsListResponse(BaseModel):
     total_sessions: int = Field(..., description="Total session count")
     active_sessions: int = Field(..., description="Active session count")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "sessions": [],
-                "total_sessions": 5,
-                "active_sessions": 2
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
 
 
 class StreamingResponse(BaseModel):
-    """Streaming chat response schema."""
+    """Streaming chat response schema.
+    
+    Documents the frame format; frames are serialized with core.responses.stream_event.
+    """
     
     type: str = Field(..., description="Response type: 'token', 'complete', 'error'")
     content: Optional[str] = Field(None, description="Response content")
     message_id: Optional[str] = Field(None, description="Message ID (for complete responses)")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "type": "token",
-                "content": "To establish",
-                "metadata": {}
-            }
-        }
+    model_config = ConfigDict(defer_build=True)
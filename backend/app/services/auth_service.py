@@ -2,7 +2,8 @@
 Authentication service for business logic.
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+from typing import Optional, Dict, Any, Set
 from datetime import timedelta
 
 from ..repositories.user_repository import UserRepository
@@ -17,22 +18,46 @@ from ..core.exceptions import (
 )
 
 
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_bg_tasks: Set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> None:
+    """Run a coroutine in the background without awaiting it."""
+    task = asyncio.create_task(coro)
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+
+
 class AuthService:
     """Authentication service for user management."""
     
     def __init__(self):
         self.user_repo = UserRepository()
+        # Admin account memo for the process lifetime; the lock keeps
+        # concurrent first callers from racing to create it
+        self._admin_memo: Optional[UserInDB] = None
+        self._admin_lock = asyncio.Lock()
     
-    async def register_user(self, registration_data: UserRegistration) -> TokenResponse:
-        """Register a new user."""
-        # Validate password strength
-        if not validate_password_strength(registration_data.password):
+    async def warmup(self) -> None:
+        """Open database connections ahead of the first real request."""
+        await self.user_repo.ping()
+    
+    @staticmethod
+    def _validate_password_strength(password: str) -> None:
+        """Raise ValidationError if the password is too weak (no I/O)."""
+        if not validate_password_strength(password):
             raise ValidationError(
                 "Password must be at least 8 characters with uppercase, lowercase, and number"
             )
+    
+    async def register_user(self, registration_data: UserRegistration) -> TokenResponse:
+        """Register a new user."""
+        # Validate password strength
+        self._validate_password_strength(registration_data.password)
         
         # Hash password
-        password_hash = security.hash_password(registration_data.password)
+        password_hash = await security.hash_password(registration_data.password)
         
         # Create user data
         user_data = {
@@ -57,18 +82,18 @@ class AuthService:
             refresh_token = security.create_refresh_token(token_data)
             
             # Create response
-            user_response = UserResponse(
+            user_response = UserResponse.model_construct(
                 id=str(user.id),
                 email=user.email,
                 role=user.role,
                 status=user.status,
-                created_at=user.created_at.isoformat()
+                created_at=user.created_at_iso
             )
             
-            return TokenResponse(
+            return TokenResponse.model_construct(
                 access_token=access_token,
                 token_type="bearer",
-                expires_in=security.expire_minutes * 60,
+                expires_in=security.expire_seconds,
                 user=user_response
             )
             
@@ -78,21 +103,21 @@ class AuthService:
     async def login_user(self, login_data: UserLogin) -> TokenResponse:
         """Authenticate user login."""
         # Get user by email
-        user = await self.user_repo.get_user_by_email(login_data.email)
+        user = await self.user_repo.get_user_for_auth(login_data.email)
         
         if not user:
             raise AuthenticationError("Invalid email or password")
         
         # Verify password
-        if not security.verify_password(login_data.password, user.password_hash):
+        if not await security.verify_password(login_data.password, user.password_hash):
             raise AuthenticationError("Invalid email or password")
         
         # Check if user is active
         if not user.is_active():
             raise AuthenticationError("Account is deactivated")
         
-        # Update last login
-        await self.user_repo.update_last_login(str(user.id))
+        # Update last login in the background so it does not delay the response
+        _spawn(self.user_repo.update_last_login(str(user.id)))
         
         # Generate tokens
         token_data = generate_user_token_data(
@@ -110,18 +135,18 @@ class AuthService:
         refresh_token = security.create_refresh_token(token_data)
         
         # Create response
-        user_response = UserResponse(
+        user_response = UserResponse.model_construct(
             id=str(user.id),
             email=user.email,
             role=user.role,
             status=user.status,
-            created_at=user.created_at.isoformat()
+            created_at=user.created_at_iso
         )
         
-        return TokenResponse(
+        return TokenResponse.model_construct(
             access_token=access_token,
             token_type="bearer",
-            expires_in=(expires_delta.total_seconds() if expires_delta else security.expire_minutes * 60),
+            expires_in=(int(expires_delta.total_seconds()) if expires_delta else security.expire_seconds),
             user=user_response
         )
     
@@ -151,18 +176,18 @@ class AuthService:
             access_token = security.create_access_token(new_token_data)
             
             # Create response
-            user_response = UserResponse(
+            user_response = UserResponse.model_construct(
                 id=str(user.id),
                 email=user.email,
                 role=user.role,
                 status=user.status,
-                created_at=user.created_at.isoformat()
+                created_at=user.created_at_iso
             )
             
-            return TokenResponse(
+            return TokenResponse.model_construct(
                 access_token=access_token,
                 token_type="bearer",
-                expires_in=security.expire_minutes * 60,
+                expires_in=security.expire_seconds,
                 user=user_response
             )
             
@@ -176,12 +201,12 @@ class AuthService:
         if not user:
             raise NotFoundError("User not found")
         
-        return UserResponse(
+        return UserResponse.model_construct(
             id=str(user.id),
             email=user.email,
             role=user.role,
             status=user.status,
-            created_at=user.created_at.isoformat()
+            created_at=user.created_at_iso
         )
     
     async def change_password(
@@ -192,23 +217,20 @@ class AuthService:
     ) -> bool:
         """Change user password."""
         # Get user
-        user = await self.user_repo.get_user_by_id(user_id)
+        user = await self.user_repo.get_user_for_auth_by_id(user_id)
         
         if not user:
             raise NotFoundError("User not found")
         
         # Verify current password
-        if not security.verify_password(current_password, user.password_hash):
+        if not await security.verify_password(current_password, user.password_hash):
             raise AuthenticationError("Current password is incorrect")
         
         # Validate new password
-        if not validate_password_strength(new_password):
-            raise ValidationError(
-                "Password must be at least 8 characters with uppercase, lowercase, and number"
-            )
+        self._validate_password_strength(new_password)
         
         # Hash new password
-        new_password_hash = security.hash_password(new_password)
+        new_password_hash = await security.hash_password(new_password)
         
         # Update password
         success = await self.user_repo.change_password(user_id, new_password_hash)
@@ -218,9 +240,14 @@ class AuthService:
         
         return True
     
-    async def ensure_admin_exists(self) -> UserInDB:
-        """Ensure admin user exists."""
-        return await self.user_repo.ensure_admin_exists()
+    async def ensure_admin_exists(self, force: bool = False) -> UserInDB:
+        """Ensure admin user exists (memoized; pass force=True to re-check)."""
+        if self._admin_memo is not None and not force:
+            return self._admin_memo
+        async with self._admin_lock:
+            if self._admin_memo is None or force:
+                self._admin_memo = await self.user_repo.ensure_admin_exists()
+            return self._admin_memo
     
     async def init_default_accounts(self) -> dict:
         """Initialize default admin and user accounts for testing."""
@@ -247,4 +274,8 @@ class AuthService:
         if not success:
             raise NotFoundError("User not found")
         
+        # Drop the memoized admin if it was the account just deactivated
+        if self._admin_memo is not None and str(self._admin_memo.id) == target_user_id:
+            self._admin_memo = None
+        
         return True
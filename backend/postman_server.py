@@ -3,29 +3,53 @@
 Simple authentication server for Postman testing.
 """
 
+import hashlib
 import os
+import re
 import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Annotated, Optional
 
 # Import FastAPI and related
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+from pydantic import AfterValidator, BaseModel
+from email_validator import validate_email
+import jwt
+from jwt import InvalidTokenError as JWTError
+import bcrypt
+import orjson
+from cachetools import TTLCache
 import uvicorn
 
 # Configuration
 JWT_SECRET = "EasyLawSecret2024"
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRE_MINUTES = 1440
+JWT_EXPIRE_SECONDS = JWT_EXPIRE_MINUTES * 60
+BCRYPT_ROUNDS = 12
+
+# At least 8 characters with an uppercase letter, a lowercase letter and a digit
+# (ASCII only; non-ASCII passwords fall back to the str.is* checks)
+_PW_RE = re.compile(r"^(?=.*[A-Z])(?=.*[a-z])(?=.*\d).{8,}$", re.DOTALL)
 
 # Security setup
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security_scheme = HTTPBearer()
 
+# Memoized bcrypt results keyed by (hash, sha256(password)); failures expire
+# quickly so cached misses cannot speed up password guessing
+_verify_cache = TTLCache(maxsize=1024, ttl=60)
+_verify_fail_cache = TTLCache(maxsize=1024, ttl=5)
+
+# Verified JWT payloads keyed by the raw token; each entry also stores the
+# token's own exp so it is never served past expiry
+_token_cache = TTLCache(maxsize=10000, ttl=300)
+
 # FastAPI app
 app = FastAPI(
     title="EasyLaw Authentication API",
@@ -44,26 +68,38 @@ app.add_middleware(
 
 # In-memory storage for testing (replace with MongoDB later)
 users_db = {}
+# Secondary index by user ID; values are the same dicts stored in users_db
+users_by_id = {}
+
+@lru_cache(maxsize=4096)
+def _normalize_email(email: str) -> str:
+    """Validate and normalize an email address (memoized for repeat logins)."""
+    return validate_email(email, check_deliverability=False).normalized
+
+CachedEmail = Annotated[str, AfterValidator(_normalize_email)]
 
 # Pydantic models
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: CachedEmail
     password: str
     remember_me: bool = False
 
 class UserRegister(BaseModel):
-    email: EmailStr
+    email: CachedEmail
     password: str
     confirm_password: str
 
-class UserResponse(BaseModel):
+# Response-only models are plain dataclasses; the server builds them itself
+@dataclass(slots=True)
+class UserResponse:
     id: str
     email: str
     role: str
     status: str
     created_at: str
 
-class TokenResponse(BaseModel):
+@dataclass(slots=True)
+class TokenResponse:
     access_token: str
     token_type: str
     expires_in: int
@@ -77,28 +113,47 @@ class PasswordChange(BaseModel):
 # Helper functions
 def hash_password(password: str) -> str:
     """Hash password with bcrypt."""
-    return pwd_context.hash(password)
+    # bcrypt only uses the first 72 bytes of the password
+    return bcrypt.hashpw(password.encode()[:72], bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password."""
-    return pwd_context.verify(plain_password, hashed_password)
-
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    """Create JWT token."""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+    key = (hashed_password, hashlib.sha256(plain_password.encode()).digest())
+    if key in _verify_cache:
+        return True
+    if key in _verify_fail_cache:
+        return False
+    
+    verified = bcrypt.checkpw(plain_password.encode()[:72], hashed_password.encode())
+    if verified:
+        _verify_cache[key] = True
     else:
-        expire = datetime.utcnow() + timedelta(minutes=JWT_EXPIRE_MINUTES)
+        _verify_fail_cache[key] = False
+    return verified
+
+def create_access_token(
+    data: dict,
+    expires_delta: Optional[timedelta] = None,
+    now: Optional[datetime] = None
+):
+    """Create JWT token (``now`` lets callers reuse their request timestamp)."""
+    if now is None:
+        now = datetime.utcnow()
+    expire = now + (expires_delta or timedelta(seconds=JWT_EXPIRE_SECONDS))
     
-    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
+    to_encode = {**data, "exp": expire, "iat": now}
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str):
     """Verify JWT token."""
+    cached = _token_cache.get(token)
+    if cached is not None and cached[0] > time.time():
+        return cached[1]
+    
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        _token_cache[token] = (payload.get("exp", 0), payload)
         return payload
     except JWTError:
         raise HTTPException(
@@ -109,12 +164,16 @@ def verify_token(token: str):
 
 def validate_password(password: str) -> bool:
     """Validate password strength."""
-    if len(password) < 8:
+    if _PW_RE.match(password):
+        return True
+    if password.isascii():
         return False
-    has_upper = any(c.isupper() for c in password)
-    has_lower = any(c.islower() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    return has_upper and has_lower and has_digit
+    return (
+        len(password) >= 8
+        and any(c.isupper() for c in password)
+        and any(c.islower() for c in password)
+        and any(c.isdigit() for c in password)
+    )
 
 def get_user_by_email(email: str):
     """Get user by email."""
@@ -122,10 +181,7 @@ def get_user_by_email(email: str):
 
 def get_user_by_id(user_id: str):
     """Get user by ID."""
-    for email, user in users_db.items():
-        if user["id"] == user_id:
-            return user
-    return None
+    return users_by_id.get(user_id)
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security_scheme)):
     """Get current user from token."""
@@ -161,39 +217,55 @@ def init_demo_accounts():
         }
     ]
     
-    for account in demo_accounts:
-        if account["email"] not in users_db:
-            user_id = f"user_{len(users_db) + 1}"
-            users_db[account["email"]] = {
-                "id": user_id,
-                "email": account["email"],
-                "password_hash": hash_password(account["password"]),
-                "role": account["role"],
-                "status": "active",
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
-
-# Initialize demo accounts on startup
-init_demo_accounts()
+    pending = [account for account in demo_accounts if account["email"] not in users_db]
+    if not pending:
+        return
+    
+    # bcrypt releases the GIL, so the hashes can run in parallel threads
+    with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+        password_hashes = list(executor.map(hash_password, [a["password"] for a in pending]))
+    
+    now = datetime.utcnow()
+    for account, password_hash in zip(pending, password_hashes):
+        user_id = f"user_{len(users_db) + 1}"
+        user_doc = {
+            "id": user_id,
+            "email": account["email"],
+            "password_hash": password_hash,
+            "role": account["role"],
+            "status": "active",
+            "created_at": now,
+            "updated_at": now
+        }
+        users_db[account["email"]] = user_doc
+        users_by_id[user_id] = user_doc
+
+# Initialize demo accounts on startup (not at import time)
+@app.on_event("startup")
+def seed_demo_accounts():
+    """Seed demo accounts when the server starts."""
+    init_demo_accounts()
+
+# Static payloads serialized once
+_ROOT_JSON = orjson.dumps({
+    "message": "EasyLaw Authentication API",
+    "version": "1.0.0",
+    "status": "running",
+    "docs": "/docs",
+    "endpoints": {
+        "health": "GET /health",
+        "register": "POST /api/v1/auth/register",
+        "login": "POST /api/v1/auth/login",
+        "profile": "GET /api/v1/auth/me",
+        "demo": "GET /api/v1/auth/demo-accounts"
+    }
+})
 
 # API Routes
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "message": "EasyLaw Authentication API",
-        "version": "1.0.0",
-        "status": "running",
-        "docs": "/docs",
-        "endpoints": {
-            "health": "GET /health",
-            "register": "POST /api/v1/auth/register",
-            "login": "POST /api/v1/auth/login",
-            "profile": "GET /api/v1/auth/me",
-            "demo": "GET /api/v1/auth/demo-accounts"
-        }
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 @app.get("/health")
 async def health():
@@ -244,10 +316,11 @@ async def register(user_data: UserRegister):
     }
     
     users_db[user_data.email] = user_doc
+    users_by_id[user_id] = user_doc
     
     # Create token
     token_data = {"sub": user_id, "email": user_data.email, "role": "user"}
-    access_token = create_access_token(token_data)
+    access_token = create_access_token(token_data, now=now)
     
     # Create response
     user_response = UserResponse(
@@ -261,7 +334,7 @@ async def register(user_data: UserRegister):
     return TokenResponse(
         access_token=access_token,
         token_type="bearer",
-        expires_in=JWT_EXPIRE_MINUTES * 60,
+        expires_in=JWT_EXPIRE_SECONDS,
         user=user_response
     )
 
@@ -284,19 +357,21 @@ async def login(login_data: UserLogin):
         )
     
     # Update last login
-    user["last_login"] = datetime.utcnow()
-    user["updated_at"] = datetime.utcnow()
+    now = datetime.utcnow()
+    user["last_login"] = now
+    user["last_login_iso"] = now.isoformat()
+    user["updated_at"] = now
     
     # Create token
     expires_delta = timedelta(days=30) if login_data.remember_me else None
     token_data = {"sub": user["id"], "email": user["email"], "role": user["role"]}
-    access_token = create_access_token(token_data, expires_delta)
+    access_token = create_access_token(token_data, expires_delta, now)
     
     # Calculate expires_in
     if expires_delta:
         expires_in = int(expires_delta.total_seconds())
     else:
-        expires_in = JWT_EXPIRE_MINUTES * 60
+        expires_in = JWT_EXPIRE_SECONDS
     
     # Create response
     user_response = UserResponse(
@@ -363,43 +438,46 @@ async def logout(current_user: dict = Depends(get_current_user)):
     """User logout (client-side token removal)."""
     return {"message": "Logged out successfully"}
 
-@app.get("/api/v1/auth/demo-accounts")
-async def get_demo_accounts():
-    """Get demo accounts information."""
-    return {
-        "message": "Demo accounts available for testing",
-        "accounts": {
-            "admin": {
-                "email": "admin@gmail.com",
-                "password": "Admin@12345",
-                "role": "admin"
-            },
-            "user": {
-                "email": "user@gmail.com", 
-                "password": "User@12345",
-                "role": "user"
-            }
+_DEMO_ACCOUNTS_JSON = orjson.dumps({
+    "message": "Demo accounts available for testing",
+    "accounts": {
+        "admin": {
+            "email": "admin@gmail.com",
+            "password": "Admin@12345",
+            "role": "admin"
         },
-        "usage": {
-            "login": "POST /api/v1/auth/login with email/password",
-            "register": "POST /api/v1/auth/register with email/password/confirm_password",
-            "profile": "GET /api/v1/auth/me with Authorization: Bearer <token>"
+        "user": {
+            "email": "user@gmail.com", 
+            "password": "User@12345",
+            "role": "user"
         }
+    },
+    "usage": {
+        "login": "POST /api/v1/auth/login with email/password",
+        "register": "POST /api/v1/auth/register with email/password/confirm_password",
+        "profile": "GET /api/v1/auth/me with Authorization: Bearer <token>"
     }
+})
+
+@app.get("/api/v1/auth/demo-accounts")
+async def get_demo_accounts():
+    """Get demo accounts information."""
+    return Response(content=_DEMO_ACCOUNTS_JSON, media_type="application/json")
 
 @app.get("/api/v1/auth/users")
 async def list_users():
     """List all users (for testing)."""
-    users = []
-    for email, user in users_db.items():
-        users.append({
+    users = [
+        {
             "id": user["id"],
             "email": user["email"],
             "role": user["role"],
             "status": user["status"],
             "created_at": user["created_at"].isoformat(),
-            "last_login": user.get("last_login", {}).get("isoformat", lambda: "Never")() if user.get("last_login") else "Never"
-        })
+            "last_login": user.get("last_login_iso", "Never")
+        }
+        for user in users_db.values()
+    ]
     
     return {"users": users, "total": len(users)}
 
@@ -422,6 +500,7 @@ def test_server_functions():
         print(f"[OK] JWT tokens: {decoded.get('email')}")
         
         # Test demo accounts
+        init_demo_accounts()
         demo_count = len(users_db)
         print(f"[OK] Demo accounts loaded: {demo_count}")
         
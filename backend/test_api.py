@@ -3,131 +3,150 @@
 Test FastAPI authentication endpoints.
 """
 
-import requests
-import json
+import asyncio
+import os
+import httpx
+import orjson
 import sys
 
 BASE_URL = "http://localhost:8000"
 
-def test_api():
+# Per-response details are only formatted when TEST_VERBOSE=1
+VERBOSE = os.getenv("TEST_VERBOSE") == "1"
+
+# Login bodies serialized once; the client already sends the JSON content type
+ADMIN_BODY = orjson.dumps({
+    "email": "admin@gmail.com",
+    "password": "Admin@12345"
+})
+USER_BODY = orjson.dumps({
+    "email": "user@gmail.com",
+    "password": "User@12345"
+})
+
+# Every endpoint is fixed, so requests are built once and dispatched with send()
+JSON_HEADERS = {"Content-Type": "application/json"}
+REQ_HEALTH = httpx.Request("GET", f"{BASE_URL}/health")
+REQ_INIT = httpx.Request("GET", f"{BASE_URL}/api/v1/auth/init-demo-accounts")
+REQ_ADMIN_LOGIN = httpx.Request(
+    "POST", f"{BASE_URL}/api/v1/auth/login", headers=JSON_HEADERS, content=ADMIN_BODY
+)
+REQ_USER_LOGIN = httpx.Request(
+    "POST", f"{BASE_URL}/api/v1/auth/login", headers=JSON_HEADERS, content=USER_BODY
+)
+ME_URL = httpx.URL(f"{BASE_URL}/api/v1/auth/me")
+
+def check(response, name):
+    """Print the status and return the parsed body on 200, else None."""
+    if VERBOSE:
+        print(f"Status: {response.status_code}")
+    if response.status_code == 200:
+        return orjson.loads(response.content)
+    print(f"{name} failed: {response.text[:512]}")
+    return None
+
+async def test_api():
     """Test authentication API endpoints."""
     print("=== Testing FastAPI Authentication ===")
     
-    # Test 1: Health check
-    print("\n1. Testing health check...")
-    try:
-        response = requests.get(f"{BASE_URL}/health")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-    except Exception as e:
-        print(f"Health check failed: {e}")
-        return False
-    
-    # Test 2: Initialize demo accounts
-    print("\n2. Initializing demo accounts...")
-    try:
-        response = requests.get(f"{BASE_URL}/api/v1/auth/init-demo-accounts")
-        print(f"Status: {response.status_code}")
+    # One client for all calls so the connection is kept alive and reused
+    async with httpx.AsyncClient() as client:
+        # Tests 1 and 2 are independent, so run them concurrently
+        health_response, init_response = await asyncio.gather(
+            client.send(REQ_HEALTH),
+            client.send(REQ_INIT),
+            return_exceptions=True
+        )
         
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Message: {data['message']}")
-            print("Demo accounts:")
-            for account_type, account_info in data['accounts'].items():
-                print(f"  {account_type.upper()}: {account_info['email']} / {account_info['password']}")
-        else:
-            print(f"Error: {response.text}")
-            
-    except Exception as e:
-        print(f"Demo accounts init failed: {e}")
-        return False
-    
-    # Test 3: Admin login
-    print("\n3. Testing admin login...")
-    try:
-        login_data = {
-            "email": "admin@gmail.com",
-            "password": "Admin@12345"
-        }
+        # Test 1: Health check
+        print("\n1. Testing health check...")
+        try:
+            if isinstance(health_response, Exception):
+                raise health_response
+            data = check(health_response, "Health check")
+            if VERBOSE and data is not None:
+                print(f"Response: {data}")
+        except Exception as e:
+            print(f"Health check failed: {e}")
+            return False
         
-        response = requests.post(
-            f"{BASE_URL}/api/v1/auth/login",
-            json=login_data,
-            headers={"Content-Type": "application/json"}
-        )
+        # Test 2: Initialize demo accounts
+        print("\n2. Initializing demo accounts...")
+        try:
+            if isinstance(init_response, Exception):
+                raise init_response
+            data = check(init_response, "Demo accounts init")
+            if VERBOSE and data is not None:
+                print(f"Message: {data['message']}")
+                print("Demo accounts:")
+                for account_type, account_info in data['accounts'].items():
+                    print(f"  {account_type.upper()}: {account_info['email']} / {account_info['password']}")
         
-        print(f"Status: {response.status_code}")
+        except Exception as e:
+            print(f"Demo accounts init failed: {e}")
+            return False
+        
+        # Tests 3 and 4 only need the demo accounts, so log in concurrently
+        admin_response, user_response = await asyncio.gather(
+            client.send(REQ_ADMIN_LOGIN),
+            client.send(REQ_USER_LOGIN),
+            return_exceptions=True
+        )
         
-        if response.status_code == 200:
-            data = response.json()
+        # Test 3: Admin login
+        print("\n3. Testing admin login...")
+        try:
+            if isinstance(admin_response, Exception):
+                raise admin_response
+            data = check(admin_response, "Admin login")
+            if data is None:
+                return False
+            
             print(f"Admin login successful!")
-            print(f"User: {data['user']['email']} (role: {data['user']['role']})")
-            print(f"Token: {data['access_token'][:50]}...")
+            if VERBOSE:
+                print(f"User: {data['user']['email']} (role: {data['user']['role']})")
+                print(f"Token: {data['access_token'][:50]}...")
             
             # Store token for next test
             admin_token = data['access_token']
-            
-        else:
-            print(f"Admin login failed: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"Admin login failed: {e}")
-        return False
-    
-    # Test 4: User login  
-    print("\n4. Testing user login...")
-    try:
-        login_data = {
-            "email": "user@gmail.com",
-            "password": "User@12345"
-        }
-        
-        response = requests.post(
-            f"{BASE_URL}/api/v1/auth/login",
-            json=login_data,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        print(f"Status: {response.status_code}")
         
-        if response.status_code == 200:
-            data = response.json()
-            print(f"User login successful!")
-            print(f"User: {data['user']['email']} (role: {data['user']['role']})")
-            
-        else:
-            print(f"User login failed: {response.text}")
+        except Exception as e:
+            print(f"Admin login failed: {e}")
             return False
-            
-    except Exception as e:
-        print(f"User login failed: {e}")
-        return False
-    
-    # Test 5: Get current user (with admin token)
-    print("\n5. Testing get current user...")
-    try:
-        headers = {
-            "Authorization": f"Bearer {admin_token}",
-            "Content-Type": "application/json"
-        }
         
-        response = requests.get(
-            f"{BASE_URL}/api/v1/auth/me",
-            headers=headers
-        )
+        # Test 4: User login
+        print("\n4. Testing user login...")
+        try:
+            if isinstance(user_response, Exception):
+                raise user_response
+            data = check(user_response, "User login")
+            if data is None:
+                return False
+            
+            print(f"User login successful!")
+            if VERBOSE:
+                print(f"User: {data['user']['email']} (role: {data['user']['role']})")
         
-        print(f"Status: {response.status_code}")
+        except Exception as e:
+            print(f"User login failed: {e}")
+            return False
         
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Current user: {data['email']} (role: {data['role']})")
-        else:
-            print(f"Get current user failed: {response.text}")
+        # Test 5: Get current user (with admin token)
+        print("\n5. Testing get current user...")
+        try:
+            # Only the Authorization header differs from a bare GET
+            request = httpx.Request(
+                "GET", ME_URL, headers={"Authorization": f"Bearer {admin_token}"}
+            )
+            response = await client.send(request)
             
-    except Exception as e:
-        print(f"Get current user failed: {e}")
-        return False
+            data = check(response, "Get current user")
+            if VERBOSE and data is not None:
+                print(f"Current user: {data['email']} (role: {data['role']})")
+        
+        except Exception as e:
+            print(f"Get current user failed: {e}")
+            return False
     
     print("\n" + "="*50)
     print("SUCCESS: All authentication tests passed!")
@@ -142,7 +161,7 @@ def test_api():
 
 if __name__ == "__main__":
     try:
-        success = test_api()
+        success = asyncio.run(test_api())
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
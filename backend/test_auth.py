@@ -10,9 +10,16 @@ import json
 
 # Set environment file before importing
 os.environ["ENV_FILE"] = "config/.env.dev"
+# Cheap bcrypt cost for local test runs unless explicitly overridden
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+# Per-response details are only formatted when TEST_VERBOSE=1
+VERBOSE = os.getenv("TEST_VERBOSE") == "1"
 
 try:
     from app.services.auth_service import AuthService
+    from app.repositories.user_repository import close_mongo_client
+    from app.core.security import shutdown_bcrypt_pool
     from app.schemas.auth import UserRegistration, UserLogin
     from app.core.exceptions import AuthenticationError, ValidationError, ConflictError
 except ImportError as e:
@@ -28,6 +35,13 @@ async def test_auth_system():
     
     auth_service = AuthService()
     
+    # Establish the shared MongoDB connection pool before timing anything
+    try:
+        await auth_service.warmup()
+    except Exception as e:
+        print(f"❌ Could not reach MongoDB: {e}")
+        return False
+    
     # Test 1: Initialize admin user
     print("\n1. Initializing admin user...")
     try:
@@ -48,8 +62,9 @@ async def test_auth_system():
     try:
         token_response = await auth_service.register_user(test_user_data)
         print(f"✅ User registered successfully: {token_response.user.email}")
-        print(f"   Token type: {token_response.token_type}")
-        print(f"   Expires in: {token_response.expires_in} seconds")
+        if VERBOSE:
+            print(f"   Token type: {token_response.token_type}")
+            print(f"   Expires in: {token_response.expires_in} seconds")
         
         # Store token for next test
         access_token = token_response.access_token
@@ -77,49 +92,60 @@ async def test_auth_system():
         print(f"❌ Registration validation failed: {e}")
         return False
     
+    admin_login_data = UserLogin(
+        email=admin_user.email,
+        password="admin123"  # Default admin password
+    )
+    
+    # Tests 3 and 4 are independent, so run them concurrently
+    user_info, admin_token_response = await asyncio.gather(
+        auth_service.get_current_user(user_id),
+        auth_service.login_user(admin_login_data),
+        return_exceptions=True
+    )
+    
     # Test 3: Get current user info
     print("\n3. Testing get current user...")
-    try:
-        user_info = await auth_service.get_current_user(user_id)
-        print(f"✅ Current user retrieved: {user_info.email}")
+    if isinstance(user_info, Exception):
+        print(f"❌ Failed to get current user: {user_info}")
+        return False
+    print(f"✅ Current user retrieved: {user_info.email}")
+    if VERBOSE:
         print(f"   Role: {user_info.role}")
         print(f"   Status: {user_info.status}")
-    except Exception as e:
-        print(f"❌ Failed to get current user: {e}")
-        return False
     
     # Test 4: Test admin login
     print("\n4. Testing admin login...")
-    admin_login_data = UserLogin(
-        email=admin_user.email,
-        password="admin123"  # Default admin password
-    )
-    
-    try:
-        admin_token_response = await auth_service.login_user(admin_login_data)
-        print(f"✅ Admin login successful: {admin_token_response.user.email}")
-        print(f"   Role: {admin_token_response.user.role}")
-    except AuthenticationError as e:
-        print(f"❌ Admin login failed: {e}")
+    if isinstance(admin_token_response, AuthenticationError):
+        print(f"❌ Admin login failed: {admin_token_response}")
         print("💡 Default admin password might have been changed")
+    elif isinstance(admin_token_response, Exception):
+        raise admin_token_response
+    else:
+        print(f"✅ Admin login successful: {admin_token_response.user.email}")
+        if VERBOSE:
+            print(f"   Role: {admin_token_response.user.role}")
     
     # Test 5: Test password validation
     print("\n5. Testing password validation...")
     weak_passwords = ["123", "password", "12345678"]
     
+    # Strength is checked before any database or bcrypt work, so test it directly
     for weak_pass in weak_passwords:
         try:
-            weak_user_data = UserRegistration(
-                email="weak@test.com",
-                password=weak_pass,
-                confirm_password=weak_pass
-            )
-            await auth_service.register_user(weak_user_data)
+            AuthService._validate_password_strength(weak_pass)
             print(f"❌ Weak password accepted: {weak_pass}")
         except ValidationError:
             print(f"✅ Weak password rejected: {weak_pass}")
-        except ConflictError:
-            pass  # User exists, that's ok
+    
+    # Test 6: Duplicate registration must be rejected by the unique email index
+    print("\n6. Testing duplicate registration...")
+    try:
+        await auth_service.register_user(test_user_data)
+        print(f"❌ Duplicate registration accepted: {test_user_data.email}")
+        return False
+    except ConflictError:
+        print(f"✅ Duplicate registration rejected: {test_user_data.email}")
     
     print("\n" + "=" * 50)
     print("✅ Authentication system test completed!")
@@ -128,8 +154,24 @@ async def test_auth_system():
     return True
 
 
+async def main():
+    """Run the test and release the MongoDB connection pool afterwards."""
+    try:
+        return await test_auth_system()
+    finally:
+        close_mongo_client()
+        shutdown_bcrypt_pool()
+
+
 if __name__ == "__main__":
-    success = asyncio.run(test_auth_system())
+    # uvloop ships with uvicorn[standard] on Linux/macOS; fall back to asyncio elsewhere
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
+    success = asyncio.run(main())
     if success:
         print("\n🎉 All authentication tests passed!")
     else: